@@ -6,16 +6,22 @@ YouTube MP3 Downloader - A CLI tool to download YouTube videos as MP3 files.
 import os
 import time
 import click
-import re
 import sys
 import logging
 import json
+import hashlib
 import subprocess
-import asyncio
+import threading
+import queue
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from groq import Groq
-import eyed3
+from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3NoHeaderError
 
 # Set up logging
 logging.basicConfig(
@@ -24,6 +30,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reuse one keep-alive connection to the Telegram API across notifications
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+
 def send_telegram_message(message):
     """Send a message via Telegram bot."""
     try:
@@ -41,7 +51,7 @@ def send_telegram_message(message):
             "parse_mode": "HTML"
         }
         
-        response = requests.post(url, data=data, timeout=10)
+        response = _TG_SESSION.post(url, data=data, timeout=10)
         response.raise_for_status()
         
         logger.info("📱 Telegram notification sent successfully")
@@ -54,72 +64,184 @@ def send_telegram_message(message):
         logger.error(f"❌ Unexpected error sending Telegram notification: {str(e)}")
         return False
 
-# Check if yt-dlp is installed
-try:
-    subprocess.run(['yt-dlp', '--version'], capture_output=True, text=True, check=True)
-except (subprocess.SubprocessError, FileNotFoundError):
-    logger.error("❌ yt-dlp is not installed or not in PATH. Please install it with: pip install yt-dlp")
-    sys.exit(1)
+# yt-dlp is slow to import, so it is only loaded on first use by ensure_yt_dlp()
+YoutubeDL = None
+DownloadError = None
+YoutubeDLError = None
+
+def ensure_yt_dlp():
+    """Import yt-dlp once, exiting if it is not installed."""
+    global YoutubeDL, DownloadError, YoutubeDLError
+    if YoutubeDL is not None:
+        return
+    try:
+        from yt_dlp import YoutubeDL as _YoutubeDL
+        from yt_dlp.utils import DownloadError as _DownloadError
+        from yt_dlp.utils import YoutubeDLError as _YoutubeDLError
+    except ImportError:
+        logger.error("❌ yt-dlp is not installed. Please install it with: pip install yt-dlp")
+        sys.exit(1)
+    DownloadError = _DownloadError
+    YoutubeDLError = _YoutubeDLError
+    YoutubeDL = _YoutubeDL
+
+# yt-dlp records finished downloads here, one "youtube <video id>" line each
+ARCHIVE_FILENAME = ".archive.txt"
+
+def read_download_archive(output_dir):
+    """Return the set of entries in output_dir's download archive."""
+    try:
+        with open(os.path.join(output_dir, ARCHIVE_FILENAME), encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        return set()
+
+# YoutubeDL instances are reused so yt-dlp's player-JS and signature caches
+# persist across videos; each download thread gets its own since they are not thread-safe
+_ydl_local = threading.local()
+
+def get_ydl(output_dir=None, noplaylist=True):
+    """Return this thread's YoutubeDL instance, downloading into output_dir if given."""
+    ensure_yt_dlp()
+    instances = getattr(_ydl_local, 'instances', None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+    
+    key = (output_dir, noplaylist)
+    if key not in instances:
+        opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'noplaylist': noplaylist,
+        }
+        if output_dir is not None:
+            opts.update({
+                'format': 'bestaudio',
+                'outtmpl': f"{output_dir}/%(title)s.%(ext)s",
+                'download_archive': os.path.join(output_dir, ARCHIVE_FILENAME),
+                # Same as yt-dlp's -N: fetch fragmented formats over several connections
+                'concurrent_fragment_downloads': 4,
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': '0',  # Best quality
+                }],
+            })
+        instances[key] = YoutubeDL(opts)
+    return instances[key]
+
+# Characters that are not allowed in filenames, removed with str.translate
+_FILENAME_TRANS = str.maketrans('', '', '\\/*?:"<>|')
 
 def sanitize_filename(filename):
     """Remove invalid characters from filename."""
     if not filename:
         return "unknown_title"
-    return re.sub(r'[\\/*?:"<>|]', "", filename)
+    return filename.translate(_FILENAME_TRANS)
+
+# orjson is optional; it parses cached playlists of thousands of entries much faster
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(data):
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return json.dumps(data).encode('utf-8')
+
+# Playlist listings are cached locally so resumed downloads skip enumeration
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ytdownloader")
+CACHE_TTL = 60 * 60  # Seconds
 
-def get_video_info(url):
-    """Get video information using yt-dlp."""
+def get_cache_path(url):
+    """Return the cache file path for url."""
+    return os.path.join(CACHE_DIR, f"{hashlib.sha1(url.encode()).hexdigest()}.json")
+
+def read_cache(url):
+    """Return the cached playlist listing for url, or None if missing or older than CACHE_TTL."""
+    cache_path = get_cache_path(url)
     try:
-        cmd = [
-            'yt-dlp',
-            '--dump-json',
-            '--no-playlist',
-            url
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        video_info = json.loads(result.stdout)
-        return video_info
-    except subprocess.SubprocessError as e:
-        logger.error(f"❌ Error getting video info: {str(e)}")
-        return None
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ Error parsing video info: {str(e)}")
+        if os.path.getmtime(cache_path) < time.time() - CACHE_TTL:
+            return None
+        with open(cache_path, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
         return None
 
-def get_playlist_info(url):
-    """Get playlist information using yt-dlp."""
+def write_cache(url, data):
+    """Store the playlist listing for url in the local cache."""
+    cache_path = get_cache_path(url)
     try:
-        cmd = [
-            'yt-dlp',
-            '--dump-json',
-            '--flat-playlist',
-            url
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        # Parse each line as a separate JSON object
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps(data))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"⚠️  Could not write playlist cache: {str(e)}")
+
+def get_playlist_info(url, use_cache=True):
+    """Yield normalized playlist entries using yt-dlp, fetching further pages only as they are consumed."""
+    if use_cache:
+        videos = read_cache(url)
+        if videos:
+            logger.info("📦 Using cached playlist info")
+            yield from videos
+            return
+    
+    ensure_yt_dlp()
+    try:
+        # Unprocessed playlist entries are flat: just the id, title and url of each video
+        ydl = get_ydl(noplaylist=False)
+        playlist_info = ydl.extract_info(url, download=False, process=False)
+        # URLs like youtu.be/<id>?list=... resolve to a redirect to the playlist page
+        while playlist_info and playlist_info.get('_type') in ('url', 'url_transparent'):
+            playlist_info = ydl.extract_info(playlist_info['url'], download=False, process=False)
+        if not playlist_info:
+            return
         videos = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                try:
-                    video_info = json.loads(line)
-                    videos.append(video_info)
-                except json.JSONDecodeError:
-                    pass
-        
-        return videos
-    except subprocess.SubprocessError as e:
+        for video_info in playlist_info.get('entries') or []:
+            if video_info:
+                # Normalize each entry once here so titles are already filename-safe downstream
+                video_id = video_info.get('id', '')
+                video = {
+                    'id': video_id,
+                    'title': (video_info.get('title') or '').translate(_FILENAME_TRANS),
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                }
+                videos.append(video)
+                yield video
+    # Later pages are fetched while iterating, outside extract_info's error handling,
+    # so they can raise ExtractorError rather than DownloadError
+    except YoutubeDLError as e:
         logger.error(f"❌ Error getting playlist info: {str(e)}")
-        return []
+        return
+    
+    # Only cache complete listings; a fresh listing is stored even when the cache
+    # was bypassed, so --no-cache refreshes it for later runs
+    write_cache(url, videos)
 
-def download_audio(url, output_dir=None, suppress_notification=False, artist=None):
+def download_audio(url, output_dir=None, suppress_notification=False, artist=None, sync=True, metadata_executor=None):
     """Download audio from a YouTube video using yt-dlp."""
+    ensure_yt_dlp()
     try:
-        # Get video info first to get the title
-        video_info = get_video_info(url)
+        # Create output directory if it doesn't exist
+        if output_dir is None:
+            output_dir = os.path.join(os.getcwd(), "downloads")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        ydl = get_ydl(output_dir)
+        
+        # Extract once and reuse the result for the download; None means the
+        # video is already recorded in the download archive
+        video_info = ydl.extract_info(url, download=False, process=False)
         if not video_info:
-            logger.error(f"❌ Could not get video info for {url}")
-            return False
+            logger.info(f"✅ Already downloaded: {url}")
+            return "exists"
         
         video_title = video_info.get('title', '')
         if not video_title:
@@ -127,42 +249,25 @@ def download_audio(url, output_dir=None, suppress_notification=False, artist=Non
             video_title = f"youtube_video_{video_id}"
         
         sanitized_title = sanitize_filename(video_title)
-        logger.info(f"⬇️  Downloading: {video_title}")
-        
-        # Create output directory if it doesn't exist
-        if output_dir is None:
-            output_dir = os.path.join(os.getcwd(), "downloads")
-        
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Set the output file path
         output_path = os.path.join(output_dir, f"{sanitized_title}.mp3")
+        logger.info(f"⬇️  Downloading: {video_title}")
         
-        # Check if file already exists
-        if os.path.exists(output_path):
-            logger.info(f"✅ File already exists: {output_path}")
-            return "exists"
+        # Only the title is needed for the metadata lookup, so run it alongside the download
+        metadata_future = None
+        if not artist:
+            metadata_future = (metadata_executor or _METADATA_EXECUTOR).submit(process_metadata, video_title)
         
         # Download the audio file
-        cmd = [
-            'yt-dlp',
-            '-f', 'bestaudio',
-            '--extract-audio',
-            '--audio-format', 'mp3',
-            '--audio-quality', '0',  # Best quality
-            '-o', f"{output_dir}/{sanitized_title}.%(ext)s",
-            '--no-playlist',
-            '--progress',
-            url
-        ]
-        
-        process = subprocess.run(cmd, check=True)
-        
-        if process.returncode == 0:
-            logger.info(f"✅ Downloaded: {sanitized_title}.mp3")
+        video_info = ydl.process_ie_result(video_info, download=True)
+        
+        if video_info:
+            # Keep our own naming scheme rather than yt-dlp's filename sanitization
+            downloads = video_info.get('requested_downloads') or [{}]
+            downloaded_path = downloads[-1].get('filepath')
+            if downloaded_path and downloaded_path != output_path and os.path.exists(downloaded_path):
+                os.replace(downloaded_path, output_path)
             
-            # Wait a moment for file to be fully written
-            time.sleep(1)
+            logger.info(f"✅ Downloaded: {sanitized_title}.mp3")
             
             # Check if the final MP3 file exists
             final_mp3_path = output_path  # The output_path should already be the correct .mp3 file
@@ -173,77 +278,116 @@ def download_audio(url, output_dir=None, suppress_notification=False, artist=Non
                     title = video_title
                     update_mp3_metadata(final_mp3_path, title, artist)
                 else:
-                    # Use GROQ API to extract metadata
-                    title, extracted_artist = process_metadata(video_title)
+                    # Use GROQ API to extract metadata (usually finished by now)
+                    title, extracted_artist = metadata_future.result()
                     if title and extracted_artist:
                         update_mp3_metadata(final_mp3_path, title, extracted_artist)
                 
-                # Sync to Navidrome asynchronously
-                asyncio.run(sync_to_navidrome(final_mp3_path))
+                # Sync to Navidrome in the background (playlists sync once at the end)
+                if sync:
+                    queue_navidrome_sync(output_dir, [f"{sanitized_title}.mp3"])
                 
                 # Send Telegram notification (only if not suppressed)
                 if not suppress_notification:
-                    send_telegram_message(f"✅ <b>Download Completed!</b>\n\n🎵 {video_title}\n📁 Saved to: {output_path}\n🔄 Synced to Navidrome")
+                    send_telegram_message(f"✅ <b>Download Completed!</b>\n\n🎵 {video_title}\n📁 Saved to: {output_path}\n🔄 Syncing to Navidrome")
             else:
                 logger.warning(f"⚠️  MP3 file not found at expected path: {final_mp3_path}")
             
             return True
         else:
-            logger.error(f"❌ Error downloading {url}: Process returned {process.returncode}")
+            logger.error(f"❌ Error downloading {url}: No download info returned")
             return False
     
-    except subprocess.SubprocessError as e:
+    except DownloadError as e:
         logger.error(f"❌ Error downloading {url}: {str(e)}")
         return False
     except Exception as e:
         logger.error(f"❌ Unexpected error: {str(e)}")
         return False
 
-def download_playlist(playlist_url, output_dir=None, delay=60, artist=None):
+# Tracks whether the current playlist worker has already downloaded a video
+_worker_local = threading.local()
+
+def download_playlist_video(video_url, output_dir=None, delay=60, artist=None, metadata_executor=None):
+    """Download a single playlist entry, backing off first if this worker downloaded one before."""
+    # Add delay between downloads (skipped for each worker's first download)
+    if delay > 0 and getattr(_worker_local, 'downloaded', False):
+        logger.info(f"⏳ Waiting {delay} seconds before next download...")
+        time.sleep(delay)
+    
+    result = download_audio(video_url, output_dir, suppress_notification=True, artist=artist, sync=False,
+                            metadata_executor=metadata_executor)
+    
+    # Already downloaded files don't count towards rate limiting
+    if result == True:
+        _worker_local.downloaded = True
+    
+    return result
+
+def download_playlist(playlist_url, output_dir=None, delay=60, artist=None, jobs=4, use_cache=True):
     """Download all videos from a YouTube playlist as MP3 files."""
     try:
-        # Get playlist information
-        videos = get_playlist_info(playlist_url)
-        
-        if not videos:
-            logger.error(f"❌ No videos found in playlist: {playlist_url}")
-            return False
-        
         logger.info(f"📋 Playlist: {playlist_url}")
-        logger.info(f"🎵 Number of videos: {len(videos)}")
         
-        # Create a progress bar
-        with tqdm(total=len(videos), desc="Downloading playlist") as pbar:
-            for i, video_info in enumerate(videos):
-                video_url = f"https://www.youtube.com/watch?v={video_info.get('id', '')}" 
-                logger.info(f"🎬 Processing video {i+1}/{len(videos)}: {video_info.get('title', 'Unknown title')}")
+        if output_dir is None:
+            output_dir = os.path.join(os.getcwd(), "downloads")
+        
+        # Videos already in the download archive are skipped without any network request
+        archived = read_download_archive(output_dir)
+        
+        # Downloads are network-bound, so run several at once and start them
+        # while the rest of the playlist is still being enumerated; metadata lookups
+        # get a pool of the same size so each download can overlap with its own.
+        # The metadata pool is opened first so it only shuts down after every download has finished
+        with tqdm(total=0, desc="Downloading playlist") as pbar, \
+                ThreadPoolExecutor(max_workers=max(1, jobs)) as metadata_executor, \
+                ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            total = 0
+            futures = []
+            for video_info in get_playlist_info(playlist_url, use_cache):
+                total += 1
+                pbar.total = total
+                video_title = video_info['title']
+                
+                # Titles are pre-sanitized, which also catches files downloaded before the archive existed
+                if (f"youtube {video_info['id']}" in archived
+                        or video_title and os.path.exists(os.path.join(output_dir, f"{video_title}.mp3"))):
+                    logger.info(f"✅ Already downloaded: {video_title}")
+                    pbar.update(1)
+                    continue
                 
-                result = download_audio(video_url, output_dir, suppress_notification=True, artist=artist)
-                success = result == True or result == "exists"
-                pbar.update(1)
-
-                # Add delay between downloads (except for the last video and when file already exists)
-                if i < len(videos) - 1 and result == True:
-                    logger.info(f"⏳ Waiting {delay} seconds before next download...")
-                    for remaining in range(delay, 0, -1):
-                        if remaining % 10 == 0:  # Only log every 10 seconds
-                            logger.info(f"⏳ Waiting {remaining} more seconds...")
-                        time.sleep(1)
+                logger.info(f"🎬 Queued video {total}: {video_title or 'Unknown title'}")
+                future = executor.submit(
+                    download_playlist_video, video_info['url'], output_dir, delay, artist, metadata_executor
+                )
+                future.add_done_callback(lambda _: pbar.update(1))
+                futures.append(future)
+                pbar.refresh()
+            
+            if not total:
+                logger.error(f"❌ No videos found in playlist: {playlist_url}")
+                return False
+            
+            logger.info(f"🎵 Number of videos: {total}")
+            
+            for future in as_completed(futures):
+                future.result()
         
         logger.info("🎉 Playlist download completed!")
         
-        # Sync all downloaded files to Navidrome
-#        if output_dir is None:
-#            output_dir = os.path.join(os.getcwd(), "downloads")
-#        
-#        logger.info("🔄 Syncing all downloaded files to Navidrome...")
-#        for filename in os.listdir(output_dir):
-#            if filename.endswith('.mp3'):
-#                file_path = os.path.join(output_dir, filename)
-#                asyncio.run(sync_to_navidrome(file_path))
+        # Sync all downloaded files to Navidrome in a single rsync run
+        logger.info("🔄 Syncing all downloaded files to Navidrome...")
+        with os.scandir(output_dir) as entries:
+            mp3_files = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith('.mp3') and entry.is_file()
+            ]
+        if mp3_files:
+            queue_navidrome_sync(output_dir, mp3_files)
         
         # Send Telegram notification
-        send_telegram_message(f"✅ <b>Playlist Download Completed!</b>\n\n📁 Downloaded {len(videos)} videos\n🎵 Saved to: {output_dir}\n📊 All files synced to Navidrome")
+        send_telegram_message(f"✅ <b>Playlist Download Completed!</b>\n\n📁 Downloaded {total} videos\n🎵 Saved to: {output_dir}\n📊 Syncing all files to Navidrome")
         
         return True
     
@@ -251,7 +395,21 @@ def download_playlist(playlist_url, output_dir=None, delay=60, artist=None):
         logger.error(f"❌ Error downloading playlist: {str(e)}")
         return False
 
+# Prompt used to extract song metadata from a video title
+METADATA_PROMPT = "Extract the title and artist of the song out of the Youtube video title. Return the result as a JSON object with 'title' and 'artist' keys. Do NOT use markdown code blocks (```json) in your response - return only the raw JSON. Video title: {}"
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Created on first use and reused so its HTTP connection pool stays warm
+_GROQ_CLIENT = None
+_GROQ_CLIENT_LOCK = threading.Lock()
+
+# Runs the metadata lookup of a single download in parallel with it;
+# download_playlist passes its own pool sized to --jobs instead
+_METADATA_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
 def process_metadata(file_name):
+    global _GROQ_CLIENT
     # Check if API key is available
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
@@ -264,13 +422,16 @@ def process_metadata(file_name):
         return file_name, "Unknown Artist"
     
     try:
-        client = Groq(api_key=api_key)
+        with _GROQ_CLIENT_LOCK:
+            if _GROQ_CLIENT is None:
+                _GROQ_CLIENT = Groq(api_key=api_key)
+        client = _GROQ_CLIENT
 
         chat_completion = client.chat.completions.create(
             messages=[
                 {
                     "role": "user",
-                    "content": f"Extract the title and artist of the song out of the Youtube video title. Return the result as a JSON object with 'title' and 'artist' keys. Do NOT use markdown code blocks (```json) in your response - return only the raw JSON. Video title: {file_name}",
+                    "content": METADATA_PROMPT.format(file_name),
                 }
             ],
             model="llama-3.1-8b-instant",
@@ -280,28 +441,18 @@ def process_metadata(file_name):
         
         if response_content:
             try:
-                # First attempt: parse directly
-                metadata = json.loads(response_content)
+                # Parse the first JSON object in the response, ignoring any
+                # surrounding markdown code fences or prose
+                start = response_content.find('{')
+                if start == -1:
+                    raise ValueError("no JSON object found")
+                metadata, _ = _JSON_DECODER.raw_decode(response_content, start)
                 title = metadata.get('title', '')
                 artist = metadata.get('artist', '')
                 return title, artist
-            except json.JSONDecodeError:
-                # Second attempt: remove markdown code blocks and try again
-                cleaned_response = response_content.strip()
-                if cleaned_response.startswith('```json'):
-                    cleaned_response = cleaned_response[7:]  # Remove ```json
-                if cleaned_response.endswith('```'):
-                    cleaned_response = cleaned_response[:-3]  # Remove closing ```
-                cleaned_response = cleaned_response.strip()
-                
-                try:
-                    metadata = json.loads(cleaned_response)
-                    title = metadata.get('title', '')
-                    artist = metadata.get('artist', '')
-                    return title, artist
-                except json.JSONDecodeError:
-                    logger.error(f"❌ Failed to parse JSON response after cleaning: {response_content}")
-                    return '', ''
+            except (ValueError, AttributeError):
+                logger.error(f"❌ Failed to parse JSON response: {response_content}")
+                return '', ''
         else:
             logger.error("❌ Empty response from API")
             return file_name, "Unknown Artist"
@@ -321,20 +472,18 @@ def update_mp3_metadata(file_path, title, artist):
         logger.info(f"🏷️  Updating metadata for: {file_path}")
         logger.info(f"🎵 Title: '{title}', Artist: '{artist}'")
         
-        audiofile = eyed3.load(file_path)
-        if audiofile is None:
-            logger.error(f"❌ Could not load MP3 file: {file_path}")
-            return False
-        
-        if audiofile.tag is None:
+        # Only the ID3 header is read, the audio frames are left untouched
+        try:
+            tag = EasyID3(file_path)
+        except ID3NoHeaderError:
             logger.info("🏷️  Initializing new tag")
-            audiofile.initTag(version=(2, 4))
+            tag = EasyID3()
         
-        audiofile.tag.title = title
-        audiofile.tag.artist = artist
+        tag['title'] = title
+        tag['artist'] = artist
         
         # CRITICAL: Save the tag to disk
-        audiofile.tag.save()  # type: ignore
+        tag.save(file_path)
         
         logger.info(f"✅ Successfully updated metadata for {file_path}: {title} - {artist}")
         return True
@@ -342,47 +491,75 @@ def update_mp3_metadata(file_path, title, artist):
         logger.error(f"❌ Error updating metadata for {file_path}: {str(e)}")
         return False
 
-async def sync_to_navidrome(file_path):
-    """Async function to sync file to VPS using rsync."""
+def sync_to_navidrome(source_dir, file_names):
+    """Sync files from source_dir to VPS using a single rsync run."""
+    target = os.path.join(source_dir, file_names[0]) if len(file_names) == 1 else f"{len(file_names)} files"
     try:
-        logger.info(f"🔄 Starting sync to Navidrome for: {file_path}")
-        
-        # Build the rsync command to sync the specific file
-        rsync_cmd = f'rsync -avzP -e "ssh -i /home/zenha/.ssh/ocloud.key" "{file_path}" ubuntu@192.9.133.211:/home/ubuntu/navidrome/music/'
-        
-        # Run the rsync command asynchronously
-        process = await asyncio.create_subprocess_shell(
-            rsync_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        logger.info(f"🔄 Starting sync to Navidrome for: {target}")
+        
+        # Sync the given files over one SSH connection; the names are passed on
+        # stdin so the command line stays short however many files there are
+        rsync_cmd = [
+            'rsync', '-avzP',
+            '--files-from=-',
+            '-e', 'ssh -i /home/zenha/.ssh/ocloud.key',
+            source_dir,
+            'ubuntu@192.9.133.211:/home/ubuntu/navidrome/music/'
+        ]
         
-        stdout, stderr = await process.communicate()
+        process = subprocess.run(rsync_cmd, input="".join(f"{name}\n" for name in file_names), capture_output=True, text=True)
         
         if process.returncode == 0:
-            logger.info(f"✅ Successfully synced {file_path} to Navidrome")
-            if stdout:
-                logger.info(f"📤 Sync output: {stdout.decode().strip()}")
+            logger.info(f"✅ Successfully synced {target} to Navidrome")
+            if process.stdout:
+                logger.info(f"📤 Sync output: {process.stdout.strip()}")
         else:
-            logger.error(f"❌ Failed to sync {file_path} to Navidrome")
-            if stderr:
-                logger.error(f"❌ Sync error: {stderr.decode().strip()}")
+            logger.error(f"❌ Failed to sync {target} to Navidrome")
+            if process.stderr:
+                logger.error(f"❌ Sync error: {process.stderr.strip()}")
         
         return process.returncode == 0
     except Exception as e:
         logger.error(f"❌ Error during Navidrome sync: {str(e)}")
         return False
 
+# Syncs run on a single background thread so rsync overlaps with the next download
+_sync_queue = queue.Queue()
+_sync_thread = None
+_sync_thread_lock = threading.Lock()
+
+def navidrome_sync_worker():
+    """Run queued Navidrome syncs one at a time."""
+    while True:
+        source_dir, file_names = _sync_queue.get()
+        try:
+            sync_to_navidrome(source_dir, file_names)
+        finally:
+            _sync_queue.task_done()
+
+def queue_navidrome_sync(source_dir, file_names):
+    """Queue files in source_dir to be synced to Navidrome without waiting for rsync."""
+    global _sync_thread
+    with _sync_thread_lock:
+        if _sync_thread is None:
+            _sync_thread = threading.Thread(target=navidrome_sync_worker, daemon=True)
+            _sync_thread.start()
+            # Let pending syncs finish before the program exits
+            atexit.register(_sync_queue.join)
+    _sync_queue.put((source_dir, file_names))
+
 @click.command()
 @click.argument('url', required=True)
 @click.option('--output-dir', default=None, help='Directory to save the downloaded files')
 @click.option('--delay', default=20, help='Delay in seconds between playlist downloads')
 @click.option('--artist', default=None, help='Artist name to use (skips GROQ API call)')
-def cli(url, output_dir, delay, artist):
+@click.option('--jobs', default=4, help='Number of playlist videos to download in parallel')
+@click.option('--no-cache', is_flag=True, help='Ignore cached playlist info and fetch it again')
+def cli(url, output_dir, delay, artist, jobs, no_cache):
     """Download audio from YouTube video or playlist."""
     if "playlist" in url or "list=" in url:
         logger.info("📋 Detected playlist URL")
-        success = download_playlist(url, output_dir, delay, artist)
+        success = download_playlist(url, output_dir, delay, artist, jobs, not no_cache)
         if not success:
             send_telegram_message("❌ <b>Playlist Download Failed!</b>\n\nPlease check the logs for details.")
     else: